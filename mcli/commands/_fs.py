@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Filesystem helpers shared by command modules."""
+
+import os
+
+# Chunk size for streaming file comparisons
+_CHUNK_SIZE = 1 << 20
+
+
+def files_equal(file1, file2):
+    """Return True if two files have the same contents.
+
+    Files are compared in 1 MiB chunks, stopping at the first difference.
+    Raises OSError if either file can't be read.
+    """
+    with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
+        while True:
+            chunk1 = f1.read(_CHUNK_SIZE)
+            # An empty chunk1 still reads f2 so a file that grew since
+            # its size was checked isn't reported as identical
+            chunk2 = f2.read(len(chunk1) or 1)
+            if chunk1 != chunk2:
+                return False
+            if not chunk1:
+                return True
+
+
+def iter_files(path, skip_dirs=frozenset()):
+    """Yield os.DirEntry objects for the files under path, top-down.
+
+    Subdirectories named in skip_dirs are not entered. Symlinked directories
+    are not followed and unreadable directories are skipped silently,
+    matching os.walk.
+    """
+    stack = [path]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in skip_dirs:
+                                subdirs.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        # Push in reverse so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
@@ -2,12 +2,44 @@
 """Admin workarounds - user space alternatives to admin commands."""
 
 import click
+import functools
 import subprocess
 import os
+import re
 import socket
-import psutil
+from itertools import chain, islice
 from pathlib import Path
 
+_COMMENT_PREFIX = '#'
+
+# Maximum number of services listed by `admin services`
+_SERVICE_LIMIT = 50
+# Rough filter for system services hidden unless --all is given
+_SYSTEM_SERVICE_RE = re.compile(r'com\.apple\.xpc|system', re.IGNORECASE)
+
+# (task, admin command, user space alternative) rows shown by `admin sudocmds`
+_SUDOCMDS = (
+    ("View hosts file", "cat /etc/hosts", "mcli admin hosts"),
+    ("Flush DNS cache", "sudo dscacheutil -flushcache", "mcli admin dnsflush"),
+    ("View network ports", "sudo lsof -i", "mcli admin portusage"),
+    ("Network interfaces", "ifconfig", "mcli admin interfaces"),
+    ("List services", "sudo launchctl list", "mcli admin services"),
+    ("User LaunchAgents", "ls /Library/LaunchAgents", "mcli admin launchagents"),
+    ("Read preferences", "defaults read", "mcli admin defaults <domain>"),
+    ("View environment", "printenv", "mcli admin env"),
+    ("Process list", "ps aux", "mcli process list"),
+    ("Disk usage", "df -h", "mcli system disks"),
+    ("Network info", "netstat -an", "mcli admin portusage"),
+    ("System info", "sw_vers", "mcli system info"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _sudocmds_table():
+    """Return the formatted rows of the sudocmds table."""
+    return '\n'.join(f"{task:<25} {admin_cmd:<35} {user_cmd:<35}"
+                     for task, admin_cmd, user_cmd in _SUDOCMDS)
+
 
 @click.group()
 def admin():
@@ -25,18 +57,18 @@ def hosts():
     hosts_file = "/etc/hosts"
     
     try:
-        with open(hosts_file, 'r') as f:
-            content = f.read()
+        with open(hosts_file, 'r', buffering=65536) as f:
+            click.echo(f"Contents of {hosts_file}:\n")
+            click.echo("=" * 60)
             
-        click.echo(f"Contents of {hosts_file}:\n")
-        click.echo("=" * 60)
-        
-        for line_num, line in enumerate(content.split('\n'), 1):
-            # Highlight non-comment lines
-            if line.strip() and not line.strip().startswith('#'):
-                click.echo(click.style(f"{line_num:4d} | {line}", bold=True))
-            else:
-                click.echo(f"{line_num:4d} | {line}")
+            for line_num, line in enumerate(f, 1):
+                line = line.rstrip('\n')
+                stripped = line.lstrip()
+                # Highlight non-comment lines
+                if stripped and not stripped.startswith(_COMMENT_PREFIX):
+                    click.echo(click.style(f"{line_num:4d} | {line}", bold=True))
+                else:
+                    click.echo(f"{line_num:4d} | {line}")
                 
     except PermissionError:
         click.echo("Error: Permission denied to read /etc/hosts", err=True)
@@ -54,6 +86,8 @@ def dnsflush():
     Uses Python's socket cache clearing as a workaround.
     For full flush, admin privileges are required (dscacheutil -flushcache).
     """
+    import psutil
+    
     click.echo("DNS Cache Flush (User Space Workaround)")
     click.echo("=" * 60)
     
@@ -69,15 +103,16 @@ def dnsflush():
     click.echo("   User space workaround: clear application-level caches")
     
     # Check if mDNSResponder is running
-    for proc in psutil.process_iter(['pid', 'name']):
+    for proc in psutil.process_iter():
         try:
-            if 'mDNSResponder' in proc.info['name']:
-                click.echo(f"\n   mDNSResponder running (PID: {proc.info['pid']})")
-                click.echo("   To fully flush: sudo dscacheutil -flushcache")
-                click.echo("   Or: sudo killall -HUP mDNSResponder")
-                break
+            name = proc.name()
         except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
+            continue
+        if name == 'mDNSResponder':
+            click.echo(f"\n   mDNSResponder running (PID: {proc.pid})")
+            click.echo("   To fully flush: sudo dscacheutil -flushcache")
+            click.echo("   Or: sudo killall -HUP mDNSResponder")
+            break
     
     click.echo("\n✓ Application-level DNS cache cleared")
     click.echo("  (System-level cache requires sudo)")
@@ -91,39 +126,39 @@ def portusage(port):
     User space alternative to 'lsof -i' - shows network connections
     for processes the user can access.
     """
+    import psutil
+    
     click.echo("Network Port Usage (User Accessible)")
     click.echo("=" * 80)
     
     connections = psutil.net_connections(kind='inet')
     
+    # Filter and truncate lazily rather than building intermediate lists
     if port:
         # Filter by specific port
-        connections = [c for c in connections if c.laddr.port == port or 
-                      (c.raddr and c.raddr.port == port)]
+        connections = (c for c in connections if (c.laddr and c.laddr.port == port) or
+                       (c.raddr and c.raddr.port == port))
         click.echo(f"Showing processes using port {port}:\n")
     else:
         click.echo("Showing all network connections (first 50):\n")
-        connections = connections[:50]
+        connections = islice(connections, 50)
     
-    if not connections:
+    first = next(connections, None)
+    if first is None:
         click.echo(f"No connections found" + (f" on port {port}" if port else ""))
         return
+    connections = chain((first,), connections)
     
     # Header
     click.echo(f"{'Protocol':<8} {'Local Address':<25} {'Remote Address':<25} {'Status':<12} {'PID':<8} {'Process':<20}")
     click.echo("-" * 110)
     
+    # Snapshot process names once rather than querying each PID separately
+    pid_names = {p.info['pid']: p.info['name'] for p in psutil.process_iter(['pid', 'name'])}
+    
     for conn in connections:
         try:
-            # Get process name if available
-            if conn.pid:
-                try:
-                    proc = psutil.Process(conn.pid)
-                    proc_name = proc.name()
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    proc_name = "N/A"
-            else:
-                proc_name = "N/A"
+            proc_name = pid_names.get(conn.pid) or "N/A"
             
             # Format addresses
             local = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "N/A"
@@ -148,9 +183,16 @@ def interfaces():
     User space alternative to 'ifconfig' - shows network interfaces
     without requiring admin privileges.
     """
+    import psutil
+    
     click.echo("Network Interfaces (User Space)")
     click.echo("=" * 70)
     
+    # Bind address families locally for the per-address comparisons below
+    AF_INET = socket.AF_INET
+    AF_INET6 = socket.AF_INET6
+    AF_LINK = psutil.AF_LINK
+    
     # Get network interfaces
     interfaces = psutil.net_if_addrs()
     stats = psutil.net_if_stats()
@@ -159,8 +201,8 @@ def interfaces():
         click.echo(f"\n{interface_name}:")
         
         # Show status if available
-        if interface_name in stats:
-            stat = stats[interface_name]
+        stat = stats.get(interface_name)
+        if stat is not None:
             status = "UP" if stat.isup else "DOWN"
             click.echo(f"  Status: {status}")
             click.echo(f"  Speed: {stat.speed} Mbps" if stat.speed > 0 else "  Speed: Unknown")
@@ -168,17 +210,17 @@ def interfaces():
         
         # Show addresses
         for addr in addresses:
-            if addr.family == socket.AF_INET:
+            if addr.family == AF_INET:
                 click.echo(f"  IPv4: {addr.address}")
                 if addr.netmask:
                     click.echo(f"    Netmask: {addr.netmask}")
                 if addr.broadcast:
                     click.echo(f"    Broadcast: {addr.broadcast}")
-            elif addr.family == socket.AF_INET6:
+            elif addr.family == AF_INET6:
                 click.echo(f"  IPv6: {addr.address}")
                 if addr.netmask:
                     click.echo(f"    Netmask: {addr.netmask}")
-            elif addr.family == psutil.AF_LINK:
+            elif addr.family == AF_LINK:
                 click.echo(f"  MAC: {addr.address}")
 
 
@@ -210,24 +252,31 @@ def launchagents():
     
     click.echo(f"Found {len(agents)} LaunchAgent(s):\n")
     
+    # Collect loaded labels once (columns: PID, Status, Label)
+    try:
+        result = subprocess.run(
+            ['launchctl', 'list'],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        loaded = set()
+        for line in result.stdout.splitlines()[1:]:
+            fields = line.split()
+            if len(fields) >= 3:
+                loaded.add(fields[2])
+    except Exception:
+        loaded = None
+    
     for agent in sorted(agents):
         click.echo(f"  {agent.name}")
         
-        # Try to determine if it's loaded
-        try:
-            result = subprocess.run(
-                ['launchctl', 'list'],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            agent_label = agent.stem
-            if agent_label in result.stdout:
-                click.echo(f"    Status: ✓ Loaded")
-            else:
-                click.echo(f"    Status: Not loaded")
-        except Exception:
+        if loaded is None:
             click.echo(f"    Status: Unknown")
+        elif agent.stem in loaded:
+            click.echo(f"    Status: ✓ Loaded")
+        else:
+            click.echo(f"    Status: Not loaded")
     
     click.echo(f"\nLocation: {user_agents_dir}")
     click.echo("\nManage with 'launchctl' (no sudo required for user agents):")
@@ -301,13 +350,16 @@ def env():
     
     env_vars = dict(os.environ)
     
-    # Sort and display
+    # Sort and display as a single block
+    lines = []
     for key in sorted(env_vars.keys()):
         value = env_vars[key]
         # Truncate long values
         if len(value) > 100:
             value = value[:97] + "..."
-        click.echo(f"{key}={value}")
+        lines.append(f"{key}={value}")
+    if lines:
+        click.echo('\n'.join(lines))
     
     click.echo(f"\nTotal: {len(env_vars)} environment variables")
     click.echo("\nModify in ~/.zshrc, ~/.bash_profile, or ~/.bashrc:")
@@ -328,38 +380,44 @@ def services(all):
     try:
         result = subprocess.run(
             ['launchctl', 'list'],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             timeout=10
         )
         
+        # Keep only the entries that will be shown
+        lines = result.stdout.splitlines()
+        header = lines[0] if lines else ''
+        has_services = False
+        services = []
+        total = 0
+        
+        for line in islice(lines, 1, None):
+            has_services = has_services or bool(line)
+            # Show only user services unless --all (rough filter)
+            if not all and _SYSTEM_SERVICE_RE.search(line):
+                continue
+            total += 1
+            if total <= _SERVICE_LIMIT:
+                services.append(line)
+        
         if result.returncode != 0:
             click.echo("Error running launchctl list", err=True)
             return 1
         
-        lines = result.stdout.strip().split('\n')
-        
         # Skip header line
-        if len(lines) > 1:
-            header = lines[0]
+        if header and has_services:
             click.echo(header)
             click.echo("-" * 70)
             
-            services = lines[1:]
+            if services:
+                click.echo('\n'.join(services))
             
-            # Filter if not showing all
-            if not all:
-                # Show only user services (rough filter)
-                services = [s for s in services if 'com.apple.xpc' not in s.lower() 
-                           and 'system' not in s.lower()]
+            if total > _SERVICE_LIMIT:
+                click.echo(f"\n... and {total - _SERVICE_LIMIT} more")
             
-            for service in services[:50]:  # Limit to 50 entries
-                click.echo(service)
-            
-            if len(services) > 50:
-                click.echo(f"\n... and {len(services) - 50} more")
-            
-            click.echo(f"\nShowing: {min(50, len(services))} of {len(services)} services")
+            click.echo(f"\nShowing: {min(_SERVICE_LIMIT, total)} of {total} services")
         
     except subprocess.TimeoutExpired:
         click.echo("Error: Command timed out", err=True)
@@ -379,26 +437,9 @@ def sudocmds():
     click.echo("Common Admin Commands - User Space Alternatives")
     click.echo("=" * 70)
     
-    commands = [
-        ("View hosts file", "cat /etc/hosts", "mcli admin hosts"),
-        ("Flush DNS cache", "sudo dscacheutil -flushcache", "mcli admin dnsflush"),
-        ("View network ports", "sudo lsof -i", "mcli admin portusage"),
-        ("Network interfaces", "ifconfig", "mcli admin interfaces"),
-        ("List services", "sudo launchctl list", "mcli admin services"),
-        ("User LaunchAgents", "ls /Library/LaunchAgents", "mcli admin launchagents"),
-        ("Read preferences", "defaults read", "mcli admin defaults <domain>"),
-        ("View environment", "printenv", "mcli admin env"),
-        ("Process list", "ps aux", "mcli process list"),
-        ("Disk usage", "df -h", "mcli system disks"),
-        ("Network info", "netstat -an", "mcli admin portusage"),
-        ("System info", "sw_vers", "mcli system info"),
-    ]
-    
     click.echo(f"\n{'Task':<25} {'Admin Command':<35} {'User Alternative':<35}")
     click.echo("-" * 95)
-    
-    for task, admin_cmd, user_cmd in commands:
-        click.echo(f"{task:<25} {admin_cmd:<35} {user_cmd:<35}")
+    click.echo(_sudocmds_table())
     
     click.echo("\n" + "=" * 70)
     click.echo("All 'mcli admin' commands work without sudo/admin privileges!")
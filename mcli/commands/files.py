@@ -6,6 +6,84 @@ import hashlib
 import click
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from mcli.commands._fs import files_equal, iter_files
+
+# Bytes hashed per file before deciding whether a full read is needed
+_HEAD_SIZE = 4096
+# Chunk size used when streaming whole files through the hash
+_CHUNK_SIZE = 1 << 20
+# VCS, dependency and build directories pruned from traversal by default
+_SKIP_DIRS = frozenset({
+    '.git', '.hg', '.svn', 'node_modules', '__pycache__', '.venv', 'venv',
+    '.tox', '.mypy_cache', '.pytest_cache', 'dist', 'build',
+})
+
+
+def _new_hash():
+    """Return a fresh hash object for content comparison."""
+    return hashlib.blake2b(digest_size=16)
+
+
+def _head_digest(filepath):
+    """Hash the first _HEAD_SIZE bytes of a file."""
+    with open(filepath, 'rb', buffering=0) as f:
+        h = _new_hash()
+        h.update(os.read(f.fileno(), _HEAD_SIZE))
+        return h.hexdigest()
+
+
+def _full_digest(filepath):
+    """Hash the full contents of a file in fixed-size chunks."""
+    # Large buffer so each read() syscall fetches 1 MiB rather than 8 KiB
+    with open(filepath, 'rb', buffering=_CHUNK_SIZE) as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, _new_hash).hexdigest()
+        h = _new_hash()
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def _hash_file(filepath, head=False):
+    """Hash a file for duplicate detection.
+    
+    Returns a (filepath, digest, error) tuple instead of raising so that
+    warnings can be reported from the main thread.
+    """
+    try:
+        digest = _head_digest(filepath) if head else _full_digest(filepath)
+    except (OSError, IOError) as e:
+        return filepath, None, e
+    return filepath, digest, None
+
+
+def _compare_pair(pair):
+    """Compare two files byte by byte, stopping at the first difference.
+    
+    Returns a (file1, file2, equal, error) tuple instead of raising.
+    """
+    file1, file2 = pair
+    try:
+        equal = files_equal(file1, file2)
+    except (OSError, IOError) as e:
+        return file1, file2, False, e
+    return file1, file2, equal, None
+
+
+def _map_concurrently(func, items):
+    """Apply func to items on a thread pool, returning results in input order."""
+    if len(items) < 2:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(func, items))
+
+
+def _hash_files(filepaths, head=False):
+    """Hash files concurrently, returning _hash_file results in input order."""
+    return _map_concurrently(partial(_hash_file, head=head), filepaths)
 
 
 @click.group()
@@ -17,11 +95,16 @@ def files():
 @files.command()
 @click.argument('path', type=click.Path(exists=True), default='.')
 @click.option('--min-size', default=1024, help='Minimum file size in bytes (default: 1KB)')
-def duplicates(path, min_size):
+@click.option('--no-skip', is_flag=True, help='Also scan VCS, dependency and build directories')
+def duplicates(path, min_size, no_skip):
     """Find duplicate files in a directory.
     
-    Scans the specified path recursively and identifies files with identical content
-    based on MD5 hash comparison. Only files larger than min-size are checked.
+    Scans the specified path recursively and identifies files with identical content.
+    Files are grouped by size; pairs of same-size files are compared directly, while
+    larger groups are narrowed by a hash of their first 4 KB and only the remaining
+    candidates are hashed in full. Only files larger than min-size are checked.
+    Directories such as .git, node_modules and __pycache__ are skipped unless
+    --no-skip is given.
     """
     click.echo(f"Scanning for duplicates in: {path}")
     click.echo(f"Minimum file size: {min_size} bytes\n")
@@ -29,39 +112,73 @@ def duplicates(path, min_size):
     files_by_size = defaultdict(list)
     
     # Group files by size first (optimization)
-    for root, dirs, files_list in os.walk(path):
-        for filename in files_list:
-            filepath = os.path.join(root, filename)
-            try:
-                size = os.path.getsize(filepath)
-                if size >= min_size:
-                    files_by_size[size].append(filepath)
-            except (OSError, IOError) as e:
-                click.echo(f"Warning: Cannot access {filepath}: {e}", err=True)
-    
-    # Check for duplicates among files with same size
+    for entry in iter_files(path, frozenset() if no_skip else _SKIP_DIRS):
+        try:
+            size = entry.stat().st_size
+            if size >= min_size:
+                files_by_size[size].append(entry.path)
+        except (OSError, IOError) as e:
+            click.echo(f"Warning: Cannot access {entry.path}: {e}", err=True)
+    
+    # Compare same-size pairs directly; a mismatch can stop at the first byte
     duplicates_found = False
+    matched_pairs = []
+    
+    pairs = [(size, tuple(file_list)) for size, file_list in files_by_size.items()
+             if len(file_list) == 2]
+    results = _map_concurrently(_compare_pair, [pair for _, pair in pairs])
+    
+    for (size, _), (file1, file2, equal, error) in zip(pairs, results):
+        if error:
+            click.echo(f"Warning: Cannot compare {file1} and {file2}: {error}", err=True)
+        elif equal:
+            matched_pairs.append([(file1, size), (file2, size)])
+    
+    # Narrow larger same-size groups down by a hash of their first block
+    files_by_head = defaultdict(list)
+    
+    candidates = [(size, filepath) for size, file_list in files_by_size.items()
+                  if len(file_list) > 2 for filepath in file_list]
+    results = _hash_files([filepath for _, filepath in candidates], head=True)
+    
+    for (size, _), (filepath, head_hash, error) in zip(candidates, results):
+        if error:
+            click.echo(f"Warning: Cannot read {filepath}: {error}", err=True)
+        else:
+            files_by_head[(size, head_hash)].append(filepath)
+    
+    # Hash full contents only where the head hash still collides
     files_by_hash = defaultdict(list)
+    candidates = []
+    
+    for (size, head_hash), file_list in files_by_head.items():
+        if len(file_list) < 2:
+            continue
+        if size <= _HEAD_SIZE:
+            # The head hash already covered the whole file
+            files_by_hash[head_hash].extend((filepath, size) for filepath in file_list)
+        else:
+            candidates.extend((size, filepath) for filepath in file_list)
+    
+    results = _hash_files([filepath for _, filepath in candidates])
     
-    for size, file_list in files_by_size.items():
-        if len(file_list) > 1:
-            for filepath in file_list:
-                try:
-                    with open(filepath, 'rb') as f:
-                        file_hash = hashlib.md5(f.read()).hexdigest()
-                        files_by_hash[file_hash].append(filepath)
-                except (OSError, IOError) as e:
-                    click.echo(f"Warning: Cannot read {filepath}: {e}", err=True)
-    
-    # Report duplicates
-    for file_hash, file_list in files_by_hash.items():
-        if len(file_list) > 1:
-            duplicates_found = True
-            click.echo(f"Duplicate files (hash: {file_hash[:8]}...):")
-            for filepath in file_list:
-                size = os.path.getsize(filepath)
-                click.echo(f"  - {filepath} ({size} bytes)")
-            click.echo()
+    for (size, _), (filepath, file_hash, error) in zip(candidates, results):
+        if error:
+            click.echo(f"Warning: Cannot read {filepath}: {error}", err=True)
+        else:
+            files_by_hash[file_hash].append((filepath, size))
+    
+    # Report duplicates using the sizes recorded during the scan
+    groups = [("byte-for-byte match", file_list) for file_list in matched_pairs]
+    groups += [(f"hash: {file_hash[:8]}...", file_list)
+               for file_hash, file_list in files_by_hash.items() if len(file_list) > 1]
+    
+    for label, file_list in groups:
+        duplicates_found = True
+        click.echo(f"Duplicate files ({label}):")
+        for filepath, size in file_list:
+            click.echo(f"  - {filepath} ({size} bytes)")
+        click.echo()
     
     if not duplicates_found:
         click.echo("No duplicate files found.")
@@ -77,18 +194,6 @@ def diskusage(path, depth, human):
     Displays the disk space used by directories at the specified depth.
     Use --human flag for human-readable sizes (KB, MB, GB).
     """
-    def get_size(path):
-        total = 0
-        try:
-            for entry in os.scandir(path):
-                if entry.is_file(follow_symlinks=False):
-                    total += entry.stat(follow_symlinks=False).st_size
-                elif entry.is_dir(follow_symlinks=False):
-                    total += get_size(entry.path)
-        except PermissionError:
-            pass
-        return total
-    
     def format_size(size):
         if not human:
             return f"{size} bytes"
@@ -105,13 +210,37 @@ def diskusage(path, depth, human):
         click.echo(f"{format_size(size)}: {path}")
         return
     
+    # Accumulate directory sizes bottom-up in a single scandir pass: sum each
+    # directory's own files on the way down, then fold every directory into
+    # its parent in reverse visit order
+    sizes = {path: 0}
+    parents = []
+    stack = [path]
+    while stack:
+        root = stack.pop()
+        try:
+            with os.scandir(root) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            sizes[entry.path] = 0
+                            parents.append((entry.path, root))
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            sizes[root] += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    for child, parent in reversed(parents):
+        sizes[parent] += sizes[child]
+    
     # Get sizes for subdirectories
     items = []
     for entry in os.scandir(path):
         try:
             if entry.is_dir(follow_symlinks=False):
-                size = get_size(entry.path)
-                items.append((size, entry.name))
+                items.append((sizes.get(entry.path, 0), entry.name))
         except PermissionError:
             click.echo(f"Warning: Permission denied for {entry.name}", err=True)
     
@@ -127,32 +256,41 @@ def diskusage(path, depth, human):
 @click.argument('path', type=click.Path(exists=True), default='.')
 @click.option('--extension', '-e', help='Filter by file extension (e.g., .py, .txt)')
 @click.option('--case-sensitive', is_flag=True, help='Make search case-sensitive')
-def search(pattern, path, extension, case_sensitive):
+@click.option('--no-skip', is_flag=True, help='Also search VCS, dependency and build directories')
+def search(pattern, path, extension, case_sensitive, no_skip):
     """Search for files by name pattern.
     
     Searches recursively for files matching the given pattern.
-    Supports filtering by file extension.
+    Supports filtering by file extension. Directories such as .git,
+    node_modules and __pycache__ are skipped unless --no-skip is given.
     """
     import fnmatch
+    import re
     
     if not case_sensitive:
         pattern = pattern.lower()
     
+    # Build the matcher once: plain substring unless the pattern uses globs
+    if any(c in pattern for c in '*?['):
+        glob_match = re.compile(fnmatch.translate(f"*{pattern}*")).match
+        matcher = lambda name: pattern in name or glob_match(name) is not None
+    else:
+        matcher = lambda name: pattern in name
+    
     click.echo(f"Searching for '{pattern}' in: {path}\n")
     found_count = 0
     
-    for root, dirs, files_list in os.walk(path):
-        for filename in files_list:
-            # Apply extension filter if specified
-            if extension and not filename.endswith(extension):
-                continue
-            
-            # Match pattern
-            search_name = filename if case_sensitive else filename.lower()
-            if pattern in search_name or fnmatch.fnmatch(search_name, f"*{pattern}*"):
-                filepath = os.path.join(root, filename)
-                size = os.path.getsize(filepath)
-                click.echo(f"{filepath} ({size} bytes)")
-                found_count += 1
+    for entry in iter_files(path, frozenset() if no_skip else _SKIP_DIRS):
+        filename = entry.name
+        # Apply extension filter if specified
+        if extension and not filename.endswith(extension):
+            continue
+        
+        # Match pattern
+        search_name = filename if case_sensitive else filename.lower()
+        if matcher(search_name):
+            size = entry.stat().st_size
+            click.echo(f"{entry.path} ({size} bytes)")
+            found_count += 1
     
     click.echo(f"\nFound {found_count} matching file(s).")
@@ -1,12 +1,122 @@
 #!/usr/bin/env python3
 """Network utilities commands."""
 
+import errno
+import selectors
 import socket
 import click
 import time
-import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
+# Upper bound on simultaneous in-flight connects during a port scan
+_SCAN_CONCURRENCY = 512
+# Descriptors left free for stdio, the selector and everything else
+_FD_HEADROOM = 64
+_CONNECT_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN}
+_OUT_OF_FDS = {errno.EMFILE, errno.ENFILE}
+
+
+def _scan_concurrency():
+    """Return how many connects to keep in flight within the fd limit.
+    
+    macOS defaults to a soft limit of 256 descriptors, below
+    _SCAN_CONCURRENCY.
+    """
+    try:
+        import resource
+        soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (ImportError, OSError, ValueError):
+        return _SCAN_CONCURRENCY
+    if soft == resource.RLIM_INFINITY:
+        return _SCAN_CONCURRENCY
+    return max(1, min(_SCAN_CONCURRENCY, soft - _FD_HEADROOM))
+
+
+def _scan_ports(address, ports, timeout=0.5):
+    """Return the sorted list of ports accepting TCP connections on address.
+    
+    Uses nonblocking connects multiplexed through a selector so that up to
+    _SCAN_CONCURRENCY ports (fewer under a low fd limit) are probed at once,
+    each with its own timeout.
+    """
+    open_ports = []
+    ports = iter(ports)
+    pending = deque()
+    sel = selectors.DefaultSelector()
+    limit = _scan_concurrency()
+    retry_port = None
+    
+    try:
+        while True:
+            # Keep the pipeline full; pending can still hold sockets that
+            # finished behind a slower head, so count live registrations
+            while len(sel.get_map()) < limit:
+                if retry_port is not None:
+                    port, retry_port = retry_port, None
+                else:
+                    port = next(ports, None)
+                if port is None:
+                    break
+                try:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                except OSError as e:
+                    if e.errno not in _OUT_OF_FDS or not sel.get_map():
+                        raise
+                    # Out of descriptors: retry this port once some of the
+                    # pending connects have drained
+                    retry_port = port
+                    limit = len(sel.get_map())
+                    break
+                sock.setblocking(False)
+                result = sock.connect_ex((address, port))
+                if result == 0:
+                    open_ports.append(port)
+                    sock.close()
+                elif result in _CONNECT_IN_PROGRESS:
+                    sel.register(sock, selectors.EVENT_WRITE, port)
+                    pending.append((time.monotonic() + timeout, sock))
+                else:
+                    sock.close()
+            
+            if not pending:
+                break
+            
+            wait = max(0.0, pending[0][0] - time.monotonic())
+            for key, _ in sel.select(timeout=wait):
+                sock = key.fileobj
+                if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    open_ports.append(key.data)
+                sel.unregister(sock)
+                sock.close()
+            
+            # Drop completed sockets and those past their deadline
+            now = time.monotonic()
+            while pending and (pending[0][1].fileno() == -1 or pending[0][0] <= now):
+                _, sock = pending.popleft()
+                if sock.fileno() != -1:
+                    sel.unregister(sock)
+                    sock.close()
+    finally:
+        for _, sock in pending:
+            sock.close()
+        sel.close()
+    
+    return sorted(open_ports)
+
+
+def _timed_get(session, url):
+    """Fetch url with session, returning (status_code, elapsed_ms).
+    
+    The body is read in full so transfer time is included in the measurement.
+    """
+    start = time.perf_counter()
+    with session.get(url, timeout=10, stream=True) as response:
+        response.raw.read()
+    elapsed = (time.perf_counter() - start) * 1000  # Convert to ms
+    return response.status_code, elapsed
+
 
 @click.group()
 def network():
@@ -26,63 +136,90 @@ def checkport(host, port, timeout):
     """
     click.echo(f"Checking {host}:{port}...")
     
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(timeout)
-    
     try:
-        result = sock.connect_ex((host, port))
-        if result == 0:
+        # create_connection tries every resolved address, IPv4 and IPv6
+        with socket.create_connection((host, port), timeout=timeout):
             click.echo(f"✓ Port {port} is OPEN on {host}")
             return 0
-        else:
-            click.echo(f"✗ Port {port} is CLOSED on {host}")
-            return 1
     except socket.gaierror:
         click.echo(f"✗ Could not resolve hostname: {host}", err=True)
         return 1
     except socket.timeout:
         click.echo(f"✗ Connection timed out", err=True)
         return 1
-    finally:
-        sock.close()
+    except OSError:
+        click.echo(f"✗ Port {port} is CLOSED on {host}")
+        return 1
 
 
 @network.command()
 @click.option('--count', default=5, help='Number of requests to make')
 @click.option('--url', default='https://www.google.com', help='URL to test')
-def speedtest(count, url):
+@click.option('--parallel', is_flag=True, help='Issue all requests concurrently')
+def speedtest(count, url, parallel):
     """Simple network speed test.
     
     Makes multiple requests to a URL and measures response times.
     Provides min, max, and average latency statistics.
+    A warm-up request is made first so the timed requests reuse an
+    established connection. Use --parallel to send them all at once.
     """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.exceptions import HTTPError as Urllib3Error
+    
     click.echo(f"Testing network speed to: {url}")
-    click.echo(f"Making {count} requests...\n")
+    click.echo(f"Making {count} requests{' in parallel' if parallel else ''}...\n")
     
     times = []
     successful = 0
     
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=max(count, 1))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    
+    # Warm up the connection pool so timings exclude the initial handshake
+    try:
+        _timed_get(session, url)
+    except (requests.exceptions.RequestException, Urllib3Error):
+        pass
+    
+    wall_start = time.perf_counter()
+    
+    if parallel:
+        with ThreadPoolExecutor(max_workers=max(count, 1)) as executor:
+            futures = [executor.submit(_timed_get, session, url) for _ in range(count)]
+    else:
+        futures = None
+    
     for i in range(count):
         try:
-            start = time.time()
-            response = requests.get(url, timeout=10)
-            elapsed = (time.time() - start) * 1000  # Convert to ms
+            if futures is not None:
+                status_code, elapsed = futures[i].result()
+            else:
+                status_code, elapsed = _timed_get(session, url)
             
-            if response.status_code == 200:
+            if status_code == 200:
                 times.append(elapsed)
                 successful += 1
-                click.echo(f"Request {i+1}: {elapsed:.2f} ms (status: {response.status_code})")
+                click.echo(f"Request {i+1}: {elapsed:.2f} ms (status: {status_code})")
             else:
-                click.echo(f"Request {i+1}: Failed (status: {response.status_code})")
-        except requests.exceptions.RequestException as e:
+                click.echo(f"Request {i+1}: Failed (status: {status_code})")
+        # raw.read() raises urllib3's errors unwrapped, e.g. on a short body
+        except (requests.exceptions.RequestException, Urllib3Error) as e:
             click.echo(f"Request {i+1}: Failed ({str(e)})")
     
+    wall_time = (time.perf_counter() - wall_start) * 1000
+    session.close()
+    
     if times:
         click.echo(f"\nResults:")
         click.echo(f"  Successful: {successful}/{count}")
         click.echo(f"  Min: {min(times):.2f} ms")
         click.echo(f"  Max: {max(times):.2f} ms")
         click.echo(f"  Avg: {sum(times)/len(times):.2f} ms")
+        click.echo(f"  Total: {wall_time:.2f} ms")
     else:
         click.echo("\n✗ All requests failed")
 
@@ -98,27 +235,20 @@ def lookup(hostname):
     click.echo(f"Looking up: {hostname}\n")
     
     try:
-        # Get all IP addresses
-        addresses = socket.getaddrinfo(hostname, None)
+        # Get all IP addresses (one entry per address with SOCK_STREAM)
+        addresses = socket.getaddrinfo(hostname, None, type=socket.SOCK_STREAM)
         
-        ipv4_addresses = set()
-        ipv6_addresses = set()
-        
-        for addr in addresses:
-            ip = addr[4][0]
-            if ':' in ip:
-                ipv6_addresses.add(ip)
-            else:
-                ipv4_addresses.add(ip)
+        ipv4_addresses = sorted({addr[4][0] for addr in addresses if addr[0] == socket.AF_INET})
+        ipv6_addresses = sorted({addr[4][0] for addr in addresses if addr[0] == socket.AF_INET6})
         
         if ipv4_addresses:
             click.echo("IPv4 addresses:")
-            for ip in sorted(ipv4_addresses):
+            for ip in ipv4_addresses:
                 click.echo(f"  {ip}")
         
         if ipv6_addresses:
             click.echo("\nIPv6 addresses:")
-            for ip in sorted(ipv6_addresses):
+            for ip in ipv6_addresses:
                 click.echo(f"  {ip}")
         
         if not ipv4_addresses and not ipv6_addresses:
@@ -149,20 +279,15 @@ def portscan(start_port, end_port, host):
     
     click.echo(f"Scanning ports {start_port}-{end_port} on {host}...\n")
     
-    open_ports = []
+    try:
+        address = socket.gethostbyname(host)
+    except socket.gaierror:
+        click.echo(f"✗ Could not resolve hostname: {host}", err=True)
+        return 1
     
-    for port in range(start_port, end_port + 1):
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(0.5)
-        
-        try:
-            result = sock.connect_ex((host, port))
-            if result == 0:
-                open_ports.append(port)
-                click.echo(f"✓ Port {port} is OPEN")
-        except:
-            pass
-        finally:
-            sock.close()
+    open_ports = _scan_ports(address, range(start_port, end_port + 1))
+    
+    for port in open_ports:
+        click.echo(f"✓ Port {port} is OPEN")
     
     click.echo(f"\nScan complete. Found {len(open_ports)} open port(s).")
@@ -2,9 +2,51 @@
 """Process management commands."""
 
 import click
-import psutil
+import operator
 import os
+import re
 import signal
+import sys
+import time
+
+
+# Seconds over which per-process CPU usage is sampled
+_CPU_SAMPLE_INTERVAL = 0.1
+
+# Row templates for `process list` and `process find`
+_LIST_ROW_FMT = "%-8s %-30s %-10.2f %-10.2f %-10s"
+_FIND_ROW_FMT = "%-8s %-40s %-10.2f %-10.2f"
+
+# State and Threads fields of /proc/<pid>/status
+_PROC_STATUS_RE = re.compile(rb'^(State|Threads):\s+(\S+)', re.MULTILINE)
+
+
+def _linux_process_counts():
+    """Count processes, running, sleeping and threads straight from /proc.
+    
+    Reads each /proc/<pid>/status once, which carries both the state and
+    the thread count.
+    """
+    total = running = sleeping = threads = 0
+    with os.scandir('/proc') as it:
+        for entry in it:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/status", 'rb') as f:
+                    fields = dict(_PROC_STATUS_RE.findall(f.read()))
+            except OSError:
+                # Process exited while scanning
+                continue
+            
+            total += 1
+            state = fields.get(b'State')
+            if state == b'R':
+                running += 1
+            elif state == b'S':
+                sleeping += 1
+            threads += int(fields.get(b'Threads', 0))
+    return total, running, sleeping, threads
 
 
 @click.group()
@@ -23,35 +65,58 @@ def list(sort, limit):
     Shows process ID, name, CPU usage, and memory usage.
     Sorted by CPU usage by default.
     """
+    import psutil
+    
     click.echo(f"Top {limit} Processes (sorted by {sort})\n" + "=" * 80)
     click.echo(f"{'PID':<8} {'Name':<30} {'CPU %':<10} {'Memory %':<10} {'Status':<10}")
     click.echo("-" * 80)
     
     processes = []
+    attrs = ['pid', 'name', 'cpu_percent', 'memory_percent', 'status']
     
-    for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
+    # Prime every process's CPU counter, then sample them all after one
+    # shared window; fresh Process objects would otherwise report 0.0
+    psutil.process_iter.cache_clear()
+    procs = []
+    for proc in psutil.process_iter():
         try:
-            processes.append(proc.info)
+            proc.cpu_percent(interval=None)
         except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
+            continue
+        procs.append(proc)
+    time.sleep(_CPU_SAMPLE_INTERVAL)
+    
+    for proc in procs:
+        try:
+            with proc.oneshot():
+                info = proc.as_dict(attrs=attrs)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        # Materialize (cpu, mem, pid, name, status) tuples once so sorting and
+        # display index into them directly
+        processes.append((
+            info['cpu_percent'] or 0.0,
+            info['memory_percent'] or 0.0,
+            info['pid'],
+            info['name'] or 'N/A',
+            info['status'] or 'N/A',
+        ))
     
     # Sort processes
     if sort == 'cpu':
-        processes.sort(key=lambda x: x.get('cpu_percent', 0) or 0, reverse=True)
+        processes.sort(key=operator.itemgetter(0), reverse=True)
     elif sort == 'memory':
-        processes.sort(key=lambda x: x.get('memory_percent', 0) or 0, reverse=True)
+        processes.sort(key=operator.itemgetter(1), reverse=True)
     elif sort == 'name':
-        processes.sort(key=lambda x: x.get('name', '').lower())
-    
-    # Display top processes
-    for proc in processes[:limit]:
-        pid = proc.get('pid', 'N/A')
-        name = proc.get('name', 'N/A')[:29]
-        cpu = proc.get('cpu_percent') or 0
-        mem = proc.get('memory_percent') or 0
-        status = proc.get('status', 'N/A')
-        
-        click.echo(f"{pid:<8} {name:<30} {cpu:<10.2f} {mem:<10.2f} {status:<10}")
+        processes.sort(key=lambda x: x[3].lower())
+    
+    # Display top processes in a single write
+    rows = []
+    for cpu, mem, pid, name, status in processes[:limit]:
+        rows.append(_LIST_ROW_FMT % (pid, name[:29], cpu, mem, status))
+    
+    if rows:
+        click.echo('\n'.join(rows))
 
 
 @process.command()
@@ -62,22 +127,31 @@ def find(name):
     Search for processes containing the specified name.
     Shows PID, full name, and resource usage.
     """
+    import psutil
+    
     click.echo(f"Searching for processes matching: {name}\n")
     click.echo(f"{'PID':<8} {'Name':<40} {'CPU %':<10} {'Memory %':<10}")
     click.echo("-" * 80)
     
     found = False
+    # Compile the case-insensitive match once instead of lowering per process
+    matches = re.compile(re.escape(name), re.IGNORECASE).search
     
-    for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
+    psutil.process_iter.cache_clear()
+    for proc in psutil.process_iter():
         try:
-            if name.lower() in proc.info['name'].lower():
+            proc_name = proc.name()
+            # Only fetch resource usage for processes that match
+            if matches(proc_name):
+                with proc.oneshot():
+                    info = proc.as_dict(attrs=['cpu_percent', 'memory_percent'])
                 found = True
-                pid = proc.info['pid']
-                pname = proc.info['name'][:39]
-                cpu = proc.info.get('cpu_percent') or 0
-                mem = proc.info.get('memory_percent') or 0
+                pid = proc.pid
+                pname = proc_name[:39]
+                cpu = info.get('cpu_percent') or 0
+                mem = info.get('memory_percent') or 0
                 
-                click.echo(f"{pid:<8} {pname:<40} {cpu:<10.2f} {mem:<10.2f}")
+                click.echo(_FIND_ROW_FMT % (pid, pname, cpu, mem))
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
     
@@ -93,42 +167,51 @@ def info(pid):
     Shows comprehensive details about a specific process including
     CPU usage, memory, threads, files, and connections.
     """
+    import psutil
+    
     try:
         proc = psutil.Process(pid)
         
+        # Prime the CPU counter, then read it after a short window outside
+        # oneshot(), whose cached CPU times would read as 0
+        proc.cpu_percent(interval=None)
         click.echo(f"Process Information (PID: {pid})\n" + "=" * 80)
+        time.sleep(_CPU_SAMPLE_INTERVAL)
+        cpu_percent = proc.cpu_percent(interval=None)
         
-        # Basic info
-        click.echo(f"\nBasic Information:")
-        click.echo(f"  Name: {proc.name()}")
-        click.echo(f"  Status: {proc.status()}")
-        click.echo(f"  Created: {proc.create_time()}")
-        
-        try:
-            click.echo(f"  User: {proc.username()}")
-        except psutil.AccessDenied:
-            click.echo(f"  User: (Access denied)")
-        
-        # Resource usage
-        click.echo(f"\nResource Usage:")
-        click.echo(f"  CPU: {proc.cpu_percent(interval=0.1)}%")
-        
-        mem_info = proc.memory_info()
-        click.echo(f"  Memory (RSS): {mem_info.rss / (1024**2):.2f} MB")
-        click.echo(f"  Memory (VMS): {mem_info.vms / (1024**2):.2f} MB")
-        click.echo(f"  Memory %: {proc.memory_percent():.2f}%")
-        
-        # Threads
-        click.echo(f"  Threads: {proc.num_threads()}")
-        
-        # Command line
-        try:
-            cmdline = ' '.join(proc.cmdline())
-            if cmdline:
-                click.echo(f"\nCommand Line:")
-                click.echo(f"  {cmdline}")
-        except psutil.AccessDenied:
-            pass
+        # Fetch the remaining fields with a single pass over the process data
+        with proc.oneshot():
+            # Basic info
+            click.echo(f"\nBasic Information:")
+            click.echo(f"  Name: {proc.name()}")
+            click.echo(f"  Status: {proc.status()}")
+            click.echo(f"  Created: {proc.create_time()}")
+            
+            try:
+                click.echo(f"  User: {proc.username()}")
+            except psutil.AccessDenied:
+                click.echo(f"  User: (Access denied)")
+            
+            # Resource usage
+            click.echo(f"\nResource Usage:")
+            click.echo(f"  CPU: {cpu_percent}%")
+            
+            mem_info = proc.memory_info()
+            click.echo(f"  Memory (RSS): {mem_info.rss / (1024**2):.2f} MB")
+            click.echo(f"  Memory (VMS): {mem_info.vms / (1024**2):.2f} MB")
+            click.echo(f"  Memory %: {proc.memory_percent():.2f}%")
+            
+            # Threads
+            click.echo(f"  Threads: {proc.num_threads()}")
+            
+            # Command line
+            try:
+                cmdline = ' '.join(proc.cmdline())
+                if cmdline:
+                    click.echo(f"\nCommand Line:")
+                    click.echo(f"  {cmdline}")
+            except psutil.AccessDenied:
+                pass
         
         # Open files
         try:
@@ -159,6 +242,8 @@ def kill(pid, force):
     Sends SIGTERM by default, or SIGKILL with --force flag.
     Only works for processes owned by the current user.
     """
+    import psutil
+    
     try:
         proc = psutil.Process(pid)
         pname = proc.name()
@@ -192,30 +277,37 @@ def stats():
     
     Displays total number of processes, threads, and overall resource usage.
     """
-    click.echo("Process Statistics\n" + "=" * 50)
+    import psutil
     
-    total_procs = 0
-    running_procs = 0
-    sleeping_procs = 0
-    total_threads = 0
+    click.echo("Process Statistics\n" + "=" * 50)
     
-    for proc in psutil.process_iter(['status']):
-        try:
-            total_procs += 1
-            status = proc.info['status']
-            
-            if status == psutil.STATUS_RUNNING:
-                running_procs += 1
-            elif status == psutil.STATUS_SLEEPING:
-                sleeping_procs += 1
-            
+    if sys.platform.startswith('linux'):
+        total_procs, running_procs, sleeping_procs, total_threads = _linux_process_counts()
+    else:
+        total_procs = 0
+        running_procs = 0
+        sleeping_procs = 0
+        total_threads = 0
+        
+        psutil.process_iter.cache_clear()
+        for proc in psutil.process_iter():
             try:
-                total_threads += proc.num_threads()
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
+                total_procs += 1
+                with proc.oneshot():
+                    status = proc.status()
+                    
+                    if status == psutil.STATUS_RUNNING:
+                        running_procs += 1
+                    elif status == psutil.STATUS_SLEEPING:
+                        sleeping_procs += 1
+                    
+                    try:
+                        total_threads += proc.num_threads()
+                    except (psutil.AccessDenied, psutil.NoSuchProcess):
+                        pass
+                    
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
-                
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
     
     click.echo(f"  Total Processes: {total_procs}")
     click.echo(f"  Running: {running_procs}")
@@ -2,9 +2,95 @@
 """System information commands."""
 
 import click
-import psutil
-import platform
+import functools
 import os
+import threading
+import time
+from collections import deque
+
+
+# Seconds to wait for all mounts to report usage in `system disks`
+_USAGE_TIMEOUT = 10
+# Most mounts queried at once by `system disks`
+_USAGE_WORKERS = 16
+
+# platform fields shown by `system info`; invariant for a given boot
+_SYSINFO_FIELDS = ('system', 'release', 'version', 'machine', 'processor')
+
+
+def _start_usage_probes(disk_usage, mountpoints, stop):
+    """Run disk_usage on each mountpoint across up to _USAGE_WORKERS daemon threads.
+
+    Returns one (Event, dict) pair per mountpoint, in order: the Event is
+    set once the call finishes and the dict then holds 'usage' or 'error'.
+    Workers take mountpoints in order and stop picking up new ones once
+    stop is set. A statvfs hung on a dead mount can't be cancelled, so
+    the threads are daemons and never hold up interpreter exit.
+    """
+    probes = [(threading.Event(), {}) for _ in mountpoints]
+    todo = deque(zip(mountpoints, probes))
+
+    def worker():
+        while not stop.is_set():
+            try:
+                mountpoint, (done, result) = todo.popleft()
+            except IndexError:
+                return
+            try:
+                result['usage'] = disk_usage(mountpoint)
+            except Exception as e:
+                result['error'] = e
+            finally:
+                done.set()
+
+    for _ in range(min(len(probes), _USAGE_WORKERS)):
+        threading.Thread(target=worker, daemon=True).start()
+    return probes
+
+
+def _sysinfo_cache_path():
+    """Return the path of the on-disk platform info cache."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_home, 'mcli', 'sysinfo.json')
+
+
+@functools.lru_cache(maxsize=1)
+def _sysinfo():
+    """Return the platform fields shown by `system info`.
+    
+    platform.processor() shells out to uname on Linux, so the fields are
+    cached on disk keyed by boot time and only recomputed after a reboot.
+    """
+    import json
+    import platform
+    import psutil
+    
+    boot_time = psutil.boot_time()
+    path = _sysinfo_cache_path()
+    
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+        info = cached['info']
+        if cached['boot_time'] == boot_time and all(k in info for k in _SYSINFO_FIELDS):
+            return info
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    info = {field: getattr(platform, field)() for field in _SYSINFO_FIELDS}
+    
+    # Best effort: write to a temp file and swap it in so concurrent runs
+    # never read a partial cache
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'boot_time': boot_time, 'info': info}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    
+    return info
 
 
 @click.group()
@@ -20,48 +106,53 @@ def info():
     Shows OS version, CPU, memory, and other system details.
     All information is gathered from user space without special privileges.
     """
-    click.echo("System Information\n" + "=" * 50)
+    import psutil
+    
+    lines = ["System Information\n" + "=" * 50]
     
     # OS Information
-    click.echo(f"\nOperating System:")
-    click.echo(f"  System: {platform.system()}")
-    click.echo(f"  Release: {platform.release()}")
-    click.echo(f"  Version: {platform.version()}")
-    click.echo(f"  Machine: {platform.machine()}")
-    click.echo(f"  Processor: {platform.processor()}")
+    sysinfo = _sysinfo()
+    lines.append(f"\nOperating System:")
+    lines.append(f"  System: {sysinfo['system']}")
+    lines.append(f"  Release: {sysinfo['release']}")
+    lines.append(f"  Version: {sysinfo['version']}")
+    lines.append(f"  Machine: {sysinfo['machine']}")
+    lines.append(f"  Processor: {sysinfo['processor']}")
     
     # CPU Information
-    click.echo(f"\nCPU:")
-    click.echo(f"  Physical cores: {psutil.cpu_count(logical=False)}")
-    click.echo(f"  Total cores: {psutil.cpu_count(logical=True)}")
+    lines.append(f"\nCPU:")
+    lines.append(f"  Physical cores: {psutil.cpu_count(logical=False)}")
+    lines.append(f"  Total cores: {psutil.cpu_count(logical=True)}")
     cpu_freq = psutil.cpu_freq()
     if cpu_freq:
-        click.echo(f"  Max Frequency: {cpu_freq.max:.2f} MHz")
-        click.echo(f"  Current Frequency: {cpu_freq.current:.2f} MHz")
+        lines.append(f"  Max Frequency: {cpu_freq.max:.2f} MHz")
+        lines.append(f"  Current Frequency: {cpu_freq.current:.2f} MHz")
     
     # Memory Information
     memory = psutil.virtual_memory()
-    click.echo(f"\nMemory:")
-    click.echo(f"  Total: {memory.total / (1024**3):.2f} GB")
-    click.echo(f"  Available: {memory.available / (1024**3):.2f} GB")
-    click.echo(f"  Used: {memory.used / (1024**3):.2f} GB")
-    click.echo(f"  Percentage: {memory.percent}%")
+    lines.append(f"\nMemory:")
+    lines.append(f"  Total: {memory.total / (1024**3):.2f} GB")
+    lines.append(f"  Available: {memory.available / (1024**3):.2f} GB")
+    lines.append(f"  Used: {memory.used / (1024**3):.2f} GB")
+    lines.append(f"  Percentage: {memory.percent}%")
     
     # Disk Information
-    click.echo(f"\nDisk:")
+    lines.append(f"\nDisk:")
     disk = psutil.disk_usage('/')
-    click.echo(f"  Total: {disk.total / (1024**3):.2f} GB")
-    click.echo(f"  Used: {disk.used / (1024**3):.2f} GB")
-    click.echo(f"  Free: {disk.free / (1024**3):.2f} GB")
-    click.echo(f"  Percentage: {disk.percent}%")
+    lines.append(f"  Total: {disk.total / (1024**3):.2f} GB")
+    lines.append(f"  Used: {disk.used / (1024**3):.2f} GB")
+    lines.append(f"  Free: {disk.free / (1024**3):.2f} GB")
+    lines.append(f"  Percentage: {disk.percent}%")
     
     # Network
-    click.echo(f"\nNetwork Interfaces:")
+    lines.append(f"\nNetwork Interfaces:")
     net_if = psutil.net_if_addrs()
     for interface, addresses in net_if.items():
-        click.echo(f"  {interface}:")
+        lines.append(f"  {interface}:")
         for addr in addresses:
-            click.echo(f"    {addr.family.name}: {addr.address}")
+            lines.append(f"    {addr.family.name}: {addr.address}")
+    
+    click.echo('\n'.join(lines))
 
 
 @system.command()
@@ -73,6 +164,8 @@ def monitor(interval, count):
     Displays CPU usage, memory usage, and disk I/O statistics.
     Updates every 'interval' seconds for 'count' iterations.
     """
+    import psutil
+    
     click.echo("System Resource Monitor")
     click.echo("=" * 50)
     click.echo("Press Ctrl+C to stop\n")
@@ -104,6 +197,8 @@ def battery():
     
     Displays battery percentage, charging status, and time remaining.
     """
+    import psutil
+    
     if not hasattr(psutil, "sensors_battery"):
         click.echo("Battery information not available on this system.")
         return
@@ -135,26 +230,43 @@ def disks(limit):
     
     Shows mount points, file systems, and space usage for all partitions.
     """
+    import psutil
+    
     click.echo("Disk Partitions\n" + "=" * 50)
     
     partitions = psutil.disk_partitions()
     count = 0
     
-    for partition in partitions:
-        if count >= limit:
-            break
+    # Query all mounts concurrently so one slow mount (NFS, sleeping USB
+    # disk) costs at most _USAGE_TIMEOUT instead of stalling every mount
+    stop = threading.Event()
+    probes = _start_usage_probes(psutil.disk_usage,
+                                 [p.mountpoint for p in partitions], stop)
+    deadline = time.monotonic() + _USAGE_TIMEOUT
+    
+    try:
+        for partition, (done, result) in zip(partitions, probes):
+            if count >= limit:
+                break
             
-        click.echo(f"\nDevice: {partition.device}")
-        click.echo(f"  Mountpoint: {partition.mountpoint}")
-        click.echo(f"  File system: {partition.fstype}")
-        
-        try:
-            usage = psutil.disk_usage(partition.mountpoint)
+            click.echo(f"\nDevice: {partition.device}")
+            click.echo(f"  Mountpoint: {partition.mountpoint}")
+            click.echo(f"  File system: {partition.fstype}")
+            
+            if not done.wait(max(deadline - time.monotonic(), 0)):
+                click.echo(f"  (unresponsive)")
+                continue
+            if isinstance(result.get('error'), PermissionError):
+                click.echo(f"  (Permission denied)")
+                continue
+            if 'error' in result:
+                raise result['error']
+            usage = result['usage']
             click.echo(f"  Total: {usage.total / (1024**3):.2f} GB")
             click.echo(f"  Used: {usage.used / (1024**3):.2f} GB")
             click.echo(f"  Free: {usage.free / (1024**3):.2f} GB")
             click.echo(f"  Usage: {usage.percent}%")
             count += 1
-        except PermissionError:
-            click.echo(f"  (Permission denied)")
-            continue
+    finally:
+        # Past --limit, leave the remaining mounts unqueried
+        stop.set()
@@ -2,12 +2,299 @@
 """Utility commands."""
 
 import click
+import functools
 import os
 import subprocess
 import hashlib
+import math
+import mmap
+import operator
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 
+from mcli.commands._fs import files_equal, iter_files
+
+# Chunk size for streaming file reads
+_CHUNK_SIZE = 1 << 20
+
+# Files above this size are memory-mapped for hashing; below it the
+# mapping setup costs more than the read copies it saves
+_MMAP_THRESHOLD = 64 << 20
+
+# Sort key for directory entries
+_entry_name = operator.attrgetter('name')
+
+# Interpreters for script extensions in `runscript` and `runall`
+_EXT_MAP = {
+    '.py': 'python3',
+    '.sh': 'bash',
+    '.bash': 'bash',
+    '.js': 'node',
+    '.rb': 'ruby',
+    '.pl': 'perl',
+    '.php': 'php',
+}
+
+# SHA-256 throughput (MB/s) below which a SHA-NI CPU is on a slow path;
+# hardware-accelerated OpenSSL manages well over 1000
+_SHA_NI_MIN_RATE = 500
+
+# Threads reading files ahead for `zip`
+_ZIP_READERS = 4
+
+# Members per worker batch in `unzip`
+_UNZIP_BATCH = 16
+
+# Buffered output lines written per click.echo call
+_FLUSH_LINES = 4096
+
+# Fewest total bytes across files for which grep starts a process pool
+_GREP_PARALLEL_MIN_BYTES = 32 << 20
+
+# Bytes grep reads per search block; bounds memory on large files
+_GREP_BLOCK = 16 << 20
+
+
+# Digests used only as checksums, never for security
+_CHECKSUM_ALGORITHMS = frozenset(('md5', 'sha1'))
+
+
+def _new_hash(algorithm, data=b''):
+    """Create a hash object, flagging checksum-only algorithms as such.
+    
+    Marking MD5 and SHA1 with usedforsecurity=False keeps them available
+    on FIPS-enabled builds (Python 3.9+).
+    """
+    if algorithm in _CHECKSUM_ALGORITHMS:
+        try:
+            return hashlib.new(algorithm, data, usedforsecurity=False)
+        except TypeError:
+            pass
+    return hashlib.new(algorithm, data)
+
+
+def _flush_lines(lines, force=False):
+    """Write buffered output lines in one call once enough have piled up."""
+    if lines and (force or len(lines) >= _FLUSH_LINES):
+        click.echo('\n'.join(lines))
+        lines.clear()
+
+
+def _grep_block(buf, needle, ignore_case, line_num, matches):
+    """Append (line number, line) for lines of buf containing needle.
+    
+    buf holds whole lines starting at line line_num. Returns the line
+    number of the line following buf.
+    """
+    # Match text mode's universal newlines
+    if b'\r' in buf:
+        buf = buf.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    haystack = buf.lower() if ignore_case else buf
+    
+    counted = 0
+    pos = haystack.find(needle)
+    while pos >= 0:
+        start = haystack.rfind(b'\n', 0, pos) + 1
+        end = haystack.find(b'\n', pos)
+        if end < 0:
+            end = len(haystack)
+        line_num += haystack.count(b'\n', counted, start)
+        counted = start
+        line = buf[start:end].decode('utf-8', errors='ignore').rstrip()
+        matches.append((line_num, line))
+        pos = haystack.find(needle, end + 1)
+    return line_num + haystack.count(b'\n', counted)
+
+
+def _grep_matches(filepath, text, ignore_case):
+    """Return (line number, line) for each line of a file containing text.
+    
+    The file is read in blocks of whole lines, each searched as one bytes
+    buffer with bytes.find, and line numbers are worked out only for
+    matching lines. Case-insensitive searches for non-ASCII text, which
+    bytes can't lowercase, keep to a decoded line-by-line scan.
+    """
+    needle = text.encode('utf-8')
+    if not needle or b'\n' in needle or (ignore_case and not needle.isascii()):
+        search_text = text.lower() if ignore_case else text
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            return [
+                (line_num, line.rstrip())
+                for line_num, line in enumerate(f, 1)
+                if search_text in (line.lower() if ignore_case else line)
+            ]
+    if ignore_case:
+        needle = needle.lower()
+    
+    matches = []
+    line_num = 1
+    # Pieces of the current partial line, joined once its newline turns
+    # up so a very long line isn't recopied for every block
+    parts = []
+    with open(filepath, 'rb') as f:
+        while True:
+            block = f.read(_GREP_BLOCK)
+            last = len(block) < _GREP_BLOCK
+            if last:
+                parts.append(block)
+            else:
+                # Carry the partial last line over to the next block
+                cut = block.rfind(b'\n') + 1
+                if not cut:
+                    parts.append(block)
+                    continue
+                parts.append(memoryview(block)[:cut])
+            buf = b''.join(parts)
+            parts = [] if last else [block[cut:]]
+            line_num = _grep_block(buf, needle, ignore_case, line_num, matches)
+            if last:
+                return matches
+
+
+def _total_size(paths):
+    """Return the summed size in bytes of paths, skipping unreadable ones."""
+    total = 0
+    for path in paths:
+        try:
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+
+def _grep_file(job):
+    """Run _grep_matches for a (filepath, text, ignore_case) job.
+    
+    Returns (filepath, matches, None), or (filepath, None, error message)
+    if the file can't be read, so failures survive the trip back from a
+    worker process.
+    """
+    filepath = job[0]
+    try:
+        return filepath, _grep_matches(*job), None
+    except Exception as e:
+        return filepath, None, str(e)
+
+
+def _zip_add(zf, filepath, arcname):
+    """Add a file to an open zip archive, copying it in 1 MiB blocks.
+    
+    ZipFile.write copies through an 8 KiB buffer; this builds the same
+    entry but feeds the compressor much larger blocks.
+    """
+    import shutil
+    import zipfile
+    
+    zinfo = zipfile.ZipInfo.from_file(filepath, arcname)
+    zinfo.compress_type = zf.compression
+    zinfo._compresslevel = zf.compresslevel
+    with open(filepath, 'rb') as src, zf.open(zinfo, 'w') as dest:
+        shutil.copyfileobj(src, dest, _CHUNK_SIZE)
+
+
+@functools.lru_cache(maxsize=1)
+def _sha256_slow_rate():
+    """Return measured SHA-256 MB/s if a SHA-NI CPU isn't getting it, else None.
+    
+    Some OpenSSL builds stop using SHA-NI and silently run about 3x slower.
+    Only checked on Linux, where /proc/cpuinfo lists the sha_ni flag; the
+    probe hashes a few MiB once, so it's worth running only before big jobs.
+    """
+    try:
+        with open('/proc/cpuinfo', 'rb') as f:
+            if b' sha_ni' not in f.read():
+                return None
+    except OSError:
+        return None
+    
+    sample = bytes(_CHUNK_SIZE)
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        _new_hash('sha256', sample).digest()
+        best = min(best, time.perf_counter() - start)
+    rate = len(sample) / best / 1e6
+    return rate if rate < _SHA_NI_MIN_RATE else None
+
+
+def _unzip_members(archive, destination, members):
+    """Extract members of a zip archive using a private ZipFile handle.
+    
+    Each worker opens its own handle since ZipFile reads share one file
+    position. Returns the extracted member names in order.
+    """
+    import zipfile
+    
+    with zipfile.ZipFile(archive, 'r') as zf:
+        for member in members:
+            try:
+                zf.extract(member, destination)
+            except FileExistsError:
+                # Another worker created the same parent directory between
+                # ZipFile's exists check and its makedirs; it exists now
+                zf.extract(member, destination)
+    return members
+
+
+def _pasteboard():
+    """Return the general pasteboard and its string type via PyObjC.
+    
+    Talking to NSPasteboard in-process avoids spawning pbcopy/pbpaste.
+    Returns None when PyObjC (pyobjc-framework-Cocoa) isn't installed.
+    """
+    try:
+        from AppKit import NSPasteboard, NSPasteboardTypeString
+    except ImportError:
+        return None
+    return NSPasteboard.generalPasteboard(), NSPasteboardTypeString
+
+
+def _file_digests(filepath, algorithms):
+    """Return hex digests of a file for each algorithm, in order.
+    
+    The file is passed over once and each chunk is fed to every hash while
+    it is still hot in cache. Large files are memory-mapped so the hashes
+    read straight from the page cache, each in its own thread when there
+    are cores to spare; smaller files and files that cannot be mapped
+    (special or pseudo files) are read into a reusable buffer.
+    """
+    hashers = [_new_hash(algorithm) for algorithm in algorithms]
+    with open(filepath, 'rb', buffering=0) as f:
+        mm = None
+        if os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+        
+        if mm is None:
+            # Read into one reusable buffer instead of a new bytes per chunk
+            buf = bytearray(_CHUNK_SIZE)
+            with memoryview(buf) as view:
+                for n in iter(lambda: f.readinto(buf), 0):
+                    with view[:n] as chunk:
+                        for h in hashers:
+                            h.update(chunk)
+        else:
+            with mm, memoryview(mm) as view:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                if len(hashers) > 1 and (os.cpu_count() or 1) > 1:
+                    # hashlib drops the GIL while hashing large buffers, so
+                    # each digest can run over the whole mapping on its own core
+                    with ThreadPoolExecutor(max_workers=len(hashers)) as executor:
+                        for _ in executor.map(lambda h: h.update(view), hashers):
+                            pass
+                else:
+                    for offset in range(0, len(view), _CHUNK_SIZE):
+                        with view[offset:offset + _CHUNK_SIZE] as chunk:
+                            for h in hashers:
+                                h.update(chunk)
+    return [h.hexdigest() for h in hashers]
+
 
 @click.group()
 def utils():
@@ -25,16 +312,18 @@ def hash(text):
     """
     click.echo(f"Hashing: {text}\n")
     
+    data = text.encode()
+    
     # MD5
-    md5 = hashlib.md5(text.encode()).hexdigest()
+    md5 = _new_hash('md5', data).hexdigest()
     click.echo(f"MD5:    {md5}")
     
     # SHA1
-    sha1 = hashlib.sha1(text.encode()).hexdigest()
+    sha1 = _new_hash('sha1', data).hexdigest()
     click.echo(f"SHA1:   {sha1}")
     
     # SHA256
-    sha256 = hashlib.sha256(text.encode()).hexdigest()
+    sha256 = _new_hash('sha256', data).hexdigest()
     click.echo(f"SHA256: {sha256}")
 
 
@@ -49,19 +338,17 @@ def hashfile(filepath):
     click.echo(f"Hashing file: {filepath}\n")
     
     try:
-        with open(filepath, 'rb') as f:
-            data = f.read()
-            
-        # MD5
-        md5 = hashlib.md5(data).hexdigest()
-        click.echo(f"MD5:    {md5}")
+        if os.path.getsize(filepath) > _MMAP_THRESHOLD:
+            slow_rate = _sha256_slow_rate()
+            if slow_rate is not None:
+                click.echo(f"Warning: SHA-256 runs at only {slow_rate:.0f} MB/s although this "
+                           f"CPU supports SHA-NI; the OpenSSL build in use is likely not "
+                           f"hardware accelerated\n", err=True)
         
-        # SHA1
-        sha1 = hashlib.sha1(data).hexdigest()
-        click.echo(f"SHA1:   {sha1}")
+        md5, sha1, sha256 = _file_digests(filepath, ('md5', 'sha1', 'sha256'))
         
-        # SHA256
-        sha256 = hashlib.sha256(data).hexdigest()
+        click.echo(f"MD5:    {md5}")
+        click.echo(f"SHA1:   {sha1}")
         click.echo(f"SHA256: {sha256}")
         
     except IOError as e:
@@ -78,33 +365,51 @@ def tree(path, depth):
     Shows a tree view of directories and files up to the specified depth.
     Similar to the 'tree' command but works in pure user space.
     """
-    def print_tree(directory, prefix="", current_depth=0):
-        if current_depth >= depth:
-            return
-            
+    def scan(directory, prefix, lines):
+        """Return sorted entries of a directory, or None if unreadable."""
         try:
-            entries = sorted(os.listdir(directory))
+            with os.scandir(directory) as it:
+                return sorted(it, key=_entry_name)
         except PermissionError:
-            click.echo(f"{prefix}[Permission Denied]")
+            lines.append(f"{prefix}[Permission Denied]")
+            return None
+    
+    def print_tree(root, lines):
+        if depth <= 0:
+            return
+        entries = scan(root, "", lines)
+        if entries is None:
             return
         
-        for i, entry in enumerate(entries):
+        # Walk with an explicit stack of (entries, next index, prefix, depth)
+        # frames instead of recursing once per directory
+        stack = [(entries, 0, "", 0)]
+        while stack:
+            _flush_lines(lines)
+            entries, i, prefix, current_depth = stack.pop()
+            if i >= len(entries):
+                continue
+            entry = entries[i]
             is_last = i == len(entries) - 1
-            entry_path = os.path.join(directory, entry)
+            stack.append((entries, i + 1, prefix, current_depth))
             
             # Skip hidden files in root
-            if current_depth == 0 and entry.startswith('.'):
+            if current_depth == 0 and entry.name.startswith('.'):
                 continue
             
             connector = "└── " if is_last else "├── "
-            click.echo(f"{prefix}{connector}{entry}")
+            lines.append(f"{prefix}{connector}{entry.name}")
             
-            if os.path.isdir(entry_path):
+            if entry.is_dir(follow_symlinks=False) and current_depth + 1 < depth:
                 extension = "    " if is_last else "│   "
-                print_tree(entry_path, prefix + extension, current_depth + 1)
+                children = scan(entry.path, prefix + extension, lines)
+                if children:
+                    stack.append((children, 0, prefix + extension, current_depth + 1))
     
-    click.echo(f"{path}")
-    print_tree(path)
+    # Collect the tree and write it out in large batches
+    lines = [f"{path}"]
+    print_tree(path, lines)
+    _flush_lines(lines, force=True)
 
 
 @utils.command()
@@ -122,12 +427,20 @@ def timer(seconds):
     click.echo(f"Timer started for {seconds} seconds...")
     click.echo("Press Ctrl+C to cancel\n")
     
+    # Anchor every tick to a single monotonic deadline so sleep overshoot
+    # doesn't accumulate over long timers
+    deadline = time.monotonic() + seconds
     try:
-        for remaining in range(seconds, 0, -1):
-            mins, secs = divmod(remaining, 60)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            whole = math.ceil(remaining)
+            mins, secs = divmod(whole, 60)
             timeformat = f"{mins:02d}:{secs:02d}"
             click.echo(f"\r{timeformat} remaining", nl=False)
-            time.sleep(1)
+            # Sleep until the display next needs to change
+            time.sleep(remaining - (whole - 1))
         
         click.echo("\r00:00 - Time's up! \a")  # \a is the bell character
         
@@ -141,8 +454,8 @@ def timer(seconds):
 def compare(file1, file2):
     """Compare two files for equality.
     
-    Compares files byte-by-byte using hash comparison.
-    Much faster than reading entire files for large files.
+    Compares files chunk by chunk, stopping at the first difference.
+    Files of different sizes are reported without reading their contents.
     """
     click.echo(f"Comparing files:\n  {file1}\n  {file2}\n")
     
@@ -154,15 +467,11 @@ def compare(file1, file2):
         click.echo(f"✗ Files are DIFFERENT (sizes: {size1} vs {size2} bytes)")
         return
     
-    # Compare using hash
+    # Compare contents chunk by chunk
     try:
-        with open(file1, 'rb') as f:
-            hash1 = hashlib.sha256(f.read()).hexdigest()
-        
-        with open(file2, 'rb') as f:
-            hash2 = hashlib.sha256(f.read()).hexdigest()
+        identical = files_equal(file1, file2)
         
-        if hash1 == hash2:
+        if identical:
             click.echo(f"✓ Files are IDENTICAL ({size1} bytes)")
         else:
             click.echo(f"✗ Files are DIFFERENT (same size but different content)")
@@ -173,21 +482,43 @@ def compare(file1, file2):
 
 
 @utils.command()
-@click.argument('text')
+@click.argument('text', required=False)
 @click.option('--decode', is_flag=True, help='Decode from base64 instead of encoding')
-def base64(text, decode):
+@click.option('--file', '-f', 'input_file', type=click.Path(exists=True, dir_okay=False),
+              help='Read input from a file and write the raw result to stdout')
+def base64(text, decode, input_file):
     """Encode or decode base64.
     
     Encode text to base64 by default, or decode with --decode flag.
+    Use --file to process a file's bytes instead of a text argument.
     """
-    import base64 as b64
+    import binascii
     
+    if input_file is None and text is None:
+        click.echo("Error: provide TEXT or --file", err=True)
+        return 1
+    
+    # binascii is the C codec behind the base64 module, minus its wrappers
     try:
-        if decode:
-            decoded = b64.b64decode(text).decode('utf-8')
+        if input_file is not None:
+            # Map the file and write bytes straight to stdout, skipping any
+            # str round-trip
+            codec = binascii.a2b_base64 if decode else binascii.b2a_base64
+            with open(input_file, 'rb') as f:
+                # Empty files can't be mapped
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        result = codec(data)
+                else:
+                    result = codec(b'')
+            stdout = click.get_binary_stream('stdout')
+            stdout.write(result)
+            stdout.flush()
+        elif decode:
+            decoded = binascii.a2b_base64(text).decode('utf-8')
             click.echo(f"Decoded: {decoded}")
         else:
-            encoded = b64.b64encode(text.encode()).decode('utf-8')
+            encoded = binascii.b2a_base64(text.encode(), newline=False).decode('ascii')
             click.echo(f"Encoded: {encoded}")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -198,12 +529,18 @@ def base64(text, decode):
 def clipboard():
     """Display clipboard contents (macOS).
     
-    Shows the current clipboard text using pbpaste.
-    macOS only - uses native pbpaste command.
+    Shows the current clipboard text via NSPasteboard when PyObjC is
+    installed, falling back to pbpaste.
+    macOS only - uses the native pasteboard.
     """
     try:
-        result = subprocess.run(['pbpaste'], capture_output=True, text=True, check=True)
-        content = result.stdout
+        pasteboard = _pasteboard()
+        if pasteboard is not None:
+            board, string_type = pasteboard
+            content = board.stringForType_(string_type) or ''
+        else:
+            result = subprocess.run(['pbpaste'], capture_output=True, text=True, check=True)
+            content = result.stdout
         
         if content:
             click.echo("Clipboard contents:")
@@ -225,11 +562,23 @@ def clipboard():
 def setclipboard(text):
     """Copy text to clipboard (macOS).
     
-    Copies the provided text to the system clipboard using pbcopy.
-    macOS only - uses native pbcopy command.
+    Copies the provided text to the system clipboard via NSPasteboard when
+    PyObjC is installed, falling back to pbcopy.
+    macOS only - uses the native pasteboard.
     """
     try:
-        subprocess.run(['pbcopy'], input=text, text=True, check=True)
+        pasteboard = _pasteboard()
+        if pasteboard is not None:
+            board, string_type = pasteboard
+            board.clearContents()
+            if not board.setString_forType_(text, string_type):
+                click.echo("Error setting clipboard: pasteboard rejected the text", err=True)
+                return 1
+        else:
+            # Hand pbcopy the encoded bytes directly; close_fds=False lets
+            # subprocess use posix_spawn instead of fork/exec
+            subprocess.run(['pbcopy'], input=text.encode('utf-8'), close_fds=False,
+                           check=True)
         click.echo(f"✓ Copied to clipboard: {text[:50]}{'...' if len(text) > 50 else ''}")
         
     except FileNotFoundError:
@@ -257,33 +606,30 @@ def runscript(script_path, interpreter, args):
     if not interpreter:
         # Try to detect from shebang
         try:
-            with open(script_path, 'r') as f:
-                first_line = f.readline().strip()
-                if first_line.startswith('#!'):
-                    # Extract interpreter from shebang
-                    shebang = first_line[2:].strip()
-                    # Handle "#!/usr/bin/env python3" format
-                    if 'env' in shebang:
-                        interpreter = shebang.split()[-1]
-                    else:
-                        interpreter = os.path.basename(shebang)
-                    click.echo(f"Detected interpreter from shebang: {interpreter}")
+            # Read a bounded binary head so binary or oddly encoded files
+            # can't fail decoding or pull in a huge first line
+            fd = os.open(script_path, os.O_RDONLY)
+            try:
+                head = os.read(fd, 128)
+            finally:
+                os.close(fd)
+            first_line = head.split(b'\n', 1)[0].decode('utf-8', 'ignore').strip()
+            if first_line.startswith('#!'):
+                # Extract interpreter from shebang
+                shebang = first_line[2:].strip()
+                # Handle "#!/usr/bin/env python3" format
+                if 'env' in shebang:
+                    interpreter = shebang.split()[-1]
+                else:
+                    interpreter = os.path.basename(shebang)
+                click.echo(f"Detected interpreter from shebang: {interpreter}")
         except Exception:
             pass
         
         # If no shebang, try to detect from extension
         if not interpreter:
             ext = os.path.splitext(script_path)[1].lower()
-            extension_map = {
-                '.py': 'python3',
-                '.sh': 'bash',
-                '.bash': 'bash',
-                '.js': 'node',
-                '.rb': 'ruby',
-                '.pl': 'perl',
-                '.php': 'php',
-            }
-            interpreter = extension_map.get(ext, 'bash')
+            interpreter = _EXT_MAP.get(ext, 'bash')
             click.echo(f"Detected interpreter from extension: {interpreter}")
     
     click.echo(f"Running: {script_path}")
@@ -314,11 +660,14 @@ def runscript(script_path, interpreter, args):
 @click.argument('directory', type=click.Path(exists=True))
 @click.option('--pattern', '-p', default='*.sh', help='File pattern to match (default: *.sh)')
 @click.option('--interpreter', '-i', help='Force specific interpreter for all scripts')
-def runall(directory, pattern, interpreter):
+@click.option('--jobs', '-j', default=1, type=click.IntRange(min=1),
+              help='Number of scripts to run in parallel (default: 1)')
+def runall(directory, pattern, interpreter, jobs):
     """Run all scripts matching pattern in a directory.
     
-    Executes multiple scripts sequentially. Useful for batch processing
-    or running test suites. Stops on first error unless continue flag is used.
+    Executes multiple scripts sequentially, or several at once with --jobs.
+    Useful for batch processing or running test suites. Stops on first error
+    unless continue flag is used.
     """
     import glob
     
@@ -335,38 +684,60 @@ def runall(directory, pattern, interpreter):
     success_count = 0
     fail_count = 0
     
-    for script in scripts:
-        click.echo(f"{'='*60}")
-        click.echo(f"Running: {os.path.basename(script)}")
-        click.echo(f"{'='*60}")
-        
+    # Interpreter per extension, looked up once for each distinct extension
+    ext_interpreters = {}
+    
+    def command_for(script):
         # Determine interpreter
         if not interpreter:
             ext = os.path.splitext(script)[1].lower()
-            extension_map = {
-                '.py': 'python3',
-                '.sh': 'bash',
-                '.bash': 'bash',
-                '.js': 'node',
-                '.rb': 'ruby',
-                '.pl': 'perl',
-            }
-            script_interpreter = extension_map.get(ext, 'bash')
+            script_interpreter = ext_interpreters.get(ext)
+            if script_interpreter is None:
+                script_interpreter = ext_interpreters[ext] = _EXT_MAP.get(ext, 'bash')
         else:
             script_interpreter = interpreter
-        
-        try:
-            result = subprocess.run([script_interpreter, script], 
-                                  capture_output=False, text=True)
-            if result.returncode == 0:
-                success_count += 1
-                click.echo(f"✓ Success\n")
-            else:
+        return [script_interpreter, script]
+    
+    def run(script):
+        if jobs > 1:
+            # Capture output so concurrent scripts don't interleave
+            return subprocess.run(command_for(script), stdout=subprocess.PIPE,
+                                  stderr=subprocess.STDOUT, text=True,
+                                  errors='replace')
+        return subprocess.run(command_for(script), capture_output=False, text=True)
+    
+    # With --jobs, start every script up front and report them in order
+    executor = ThreadPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    pending = [executor.submit(run, script) for script in scripts] if executor else None
+    
+    try:
+        for index, script in enumerate(scripts):
+            click.echo(f"{'='*60}")
+            click.echo(f"Running: {os.path.basename(script)}")
+            click.echo(f"{'='*60}")
+            
+            try:
+                if pending is not None:
+                    result = pending[index].result()
+                    if result.stdout:
+                        click.echo(result.stdout, nl=False)
+                else:
+                    result = run(script)
+                if result.returncode == 0:
+                    success_count += 1
+                    click.echo(f"✓ Success\n")
+                else:
+                    fail_count += 1
+                    click.echo(f"✗ Failed with exit code {result.returncode}\n")
+            except Exception as e:
                 fail_count += 1
-                click.echo(f"✗ Failed with exit code {result.returncode}\n")
-        except Exception as e:
-            fail_count += 1
-            click.echo(f"✗ Error: {e}\n")
+                click.echo(f"✗ Error: {e}\n")
+    finally:
+        if executor is not None:
+            # On Ctrl+C, don't start the scripts still queued
+            for future in pending:
+                future.cancel()
+            executor.shutdown()
     
     click.echo(f"{'='*60}")
     click.echo(f"Summary: {success_count} succeeded, {fail_count} failed")
@@ -376,7 +747,8 @@ def runall(directory, pattern, interpreter):
 @utils.command()
 @click.argument('text')
 @click.argument('files', nargs=-1, type=click.Path(exists=True))
-@click.option('--ignore-case', '-i', is_flag=True, help='Case-insensitive search')
+@click.option('--ignore-case', '-i', is_flag=True,
+              help='Case-insensitive search (ASCII case folding for ASCII text)')
 @click.option('--count', '-c', is_flag=True, help='Only show count of matches')
 @click.option('--line-numbers', '-n', is_flag=True, help='Show line numbers')
 def grep(text, files, ignore_case, count, line_numbers):
@@ -389,31 +761,45 @@ def grep(text, files, ignore_case, count, line_numbers):
         click.echo("Error: No files specified", err=True)
         return 1
     
-    search_text = text.lower() if ignore_case else text
     total_matches = 0
+    lines = []
+    jobs = [(filepath, text, ignore_case) for filepath in files]
     
-    for filepath in files:
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                matches = 0
-                for line_num, line in enumerate(f, 1):
-                    compare_line = line.lower() if ignore_case else line
-                    if search_text in compare_line:
-                        matches += 1
-                        total_matches += 1
-                        if not count:
-                            prefix = f"{filepath}:" if len(files) > 1 else ""
-                            line_num_str = f"{line_num}:" if line_numbers else ""
-                            click.echo(f"{prefix}{line_num_str}{line.rstrip()}")
-                
-                if count:
-                    click.echo(f"{filepath}: {matches}")
-                    
-        except Exception as e:
-            click.echo(f"Error reading {filepath}: {e}", err=True)
+    # Scan files across processes; map keeps results in file order.
+    # Below a few tens of MB, pool startup costs more than it saves
+    executor = None
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers > 1 and _total_size(files) >= _GREP_PARALLEL_MIN_BYTES:
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(_grep_file, jobs, chunksize=max(1, len(jobs) // 64))
+    else:
+        results = map(_grep_file, jobs)
+    
+    try:
+        for filepath, matches, error in results:
+            if error is not None:
+                # Keep errors in order with the matches already found
+                _flush_lines(lines, force=True)
+                click.echo(f"Error reading {filepath}: {error}", err=True)
+                continue
+            
+            total_matches += len(matches)
+            
+            if count:
+                lines.append(f"{filepath}: {len(matches)}")
+            else:
+                prefix = f"{filepath}:" if len(files) > 1 else ""
+                for line_num, line in matches:
+                    line_num_str = f"{line_num}:" if line_numbers else ""
+                    lines.append(f"{prefix}{line_num_str}{line}")
+                    _flush_lines(lines)
+    finally:
+        if executor is not None:
+            executor.shutdown()
     
     if count and len(files) > 1:
-        click.echo(f"Total: {total_matches}")
+        lines.append(f"Total: {total_matches}")
+    _flush_lines(lines, force=True)
 
 
 @utils.command()
@@ -425,7 +811,9 @@ def download(url, output, show_progress):
     
     Simple file downloader. Saves to current directory if no output specified.
     """
+    import shutil
     import requests
+    from urllib3.exceptions import HTTPError as Urllib3Error
     
     if not output:
         output = url.split('/')[-1] or 'downloaded_file'
@@ -440,19 +828,26 @@ def download(url, output, show_progress):
         with open(output, 'wb') as f:
             if show_progress and total_size > 0:
                 downloaded = 0
-                for chunk in response.iter_content(chunk_size=8192):
+                last_percent = -1
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
                     f.write(chunk)
                     downloaded += len(chunk)
                     percent = (downloaded / total_size) * 100
-                    click.echo(f"\rProgress: {percent:.1f}%", nl=False)
+                    # Only redraw when the whole percentage moves
+                    if int(percent) != last_percent:
+                        last_percent = int(percent)
+                        click.echo(f"\rProgress: {percent:.1f}%", nl=False)
                 click.echo()  # New line after progress
             else:
-                f.write(response.content)
+                # Stream straight from the socket instead of holding the
+                # whole body in memory
+                response.raw.decode_content = True
+                shutil.copyfileobj(response.raw, f, _CHUNK_SIZE)
         
         size_mb = os.path.getsize(output) / (1024 * 1024)
         click.echo(f"✓ Downloaded to: {output} ({size_mb:.2f} MB)")
         
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, Urllib3Error) as e:
         click.echo(f"Error downloading file: {e}", err=True)
         return 1
     except IOError as e:
@@ -486,7 +881,9 @@ def urlencode(text, decode):
 @click.argument('files', nargs=-1, type=click.Path(exists=True), required=True)
 @click.argument('archive', required=True)
 @click.option('--compress', '-c', is_flag=True, help='Use compression')
-def zip(files, archive, compress):
+@click.option('--level', '-l', type=click.IntRange(1, 9), default=1,
+              help='Compression level, 1 (fastest) to 9 (smallest) (default: 1)')
+def zip(files, archive, compress, level):
     """Create a zip archive from files.
     
     Combine multiple files into a single zip archive.
@@ -499,21 +896,50 @@ def zip(files, archive, compress):
     
     try:
         compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        compresslevel = level if compress else None
+        
+        # (path, arcname) for every file, directories walked with scandir
+        members = []
+        for filepath in files:
+            if os.path.isfile(filepath):
+                members.append((filepath, os.path.basename(filepath)))
+            elif os.path.isdir(filepath):
+                # Add directory recursively
+                parent = os.path.dirname(filepath)
+                for entry in iter_files(filepath):
+                    members.append((entry.path, os.path.relpath(entry.path, parent)))
         
-        with zipfile.ZipFile(archive, 'w', compression) as zf:
-            for filepath in files:
-                if os.path.isfile(filepath):
-                    arcname = os.path.basename(filepath)
-                    zf.write(filepath, arcname)
-                    click.echo(f"Added: {filepath}")
-                elif os.path.isdir(filepath):
-                    # Add directory recursively
-                    for root, dirs, dir_files in os.walk(filepath):
-                        for file in dir_files:
-                            file_path = os.path.join(root, file)
-                            arcname = os.path.relpath(file_path, os.path.dirname(filepath))
-                            zf.write(file_path, arcname)
-                            click.echo(f"Added: {file_path}")
+        def read_small(member):
+            # Returns (ZipInfo, contents), or (ZipInfo, None) for large files
+            zinfo = zipfile.ZipInfo.from_file(*member)
+            if zinfo.file_size > _CHUNK_SIZE:
+                return zinfo, None
+            with open(member[0], 'rb') as f:
+                return zinfo, f.read()
+        
+        # Read small files ahead on a thread pool so disk reads overlap with
+        # compression; ZipFile only allows one writer, so entries are still
+        # written in order from this thread. Large files are streamed
+        with zipfile.ZipFile(archive, 'w', compression, compresslevel=compresslevel) as zf, \
+                ThreadPoolExecutor(max_workers=_ZIP_READERS) as executor:
+            remaining = iter(members)
+            pending = deque(
+                (member, executor.submit(read_small, member))
+                for member in islice(remaining, _ZIP_READERS * 2)
+            )
+            while pending:
+                (file_path, arcname), future = pending.popleft()
+                member = next(remaining, None)
+                if member is not None:
+                    pending.append((member, executor.submit(read_small, member)))
+                
+                zinfo, data = future.result()
+                if data is None:
+                    _zip_add(zf, file_path, arcname)
+                else:
+                    zf.writestr(zinfo, data, compress_type=compression,
+                                compresslevel=compresslevel)
+                click.echo(f"Added: {file_path}")
         
         size_mb = os.path.getsize(archive) / (1024 * 1024)
         click.echo(f"\n✓ Created archive: {archive} ({size_mb:.2f} MB)")
@@ -542,11 +968,23 @@ def unzip(archive, destination):
         
         with zipfile.ZipFile(archive, 'r') as zf:
             members = zf.namelist()
-            click.echo(f"Extracting {len(members)} file(s) to {destination}...")
-            
-            for member in members:
-                zf.extract(member, destination)
-                click.echo(f"Extracted: {member}")
+        click.echo(f"Extracting {len(members)} file(s) to {destination}...")
+        
+        # Decompression releases the GIL, so larger archives are extracted
+        # in batches across threads; batches come back in archive order
+        workers = min(os.cpu_count() or 1, len(members) // _UNZIP_BATCH)
+        if workers > 1:
+            batches = [members[i:i + _UNZIP_BATCH] for i in range(0, len(members), _UNZIP_BATCH)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for batch in executor.map(_unzip_members, [archive] * len(batches),
+                                          [destination] * len(batches), batches):
+                    for member in batch:
+                        click.echo(f"Extracted: {member}")
+        else:
+            with zipfile.ZipFile(archive, 'r') as zf:
+                for member in members:
+                    zf.extract(member, destination)
+                    click.echo(f"Extracted: {member}")
         
         click.echo(f"\n✓ Extracted to: {destination}")
         
@@ -565,10 +1003,24 @@ def json(json_file, query, pretty):
     Read JSON files and optionally extract specific values using dot notation.
     """
     import json as json_lib
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
     
     try:
-        with open(json_file, 'r') as f:
-            data = json_lib.load(f)
+        with open(json_file, 'rb') as f:
+            raw = f.read()
+        
+        # Parse with orjson when installed; fall back to the stdlib for
+        # anything it rejects that json accepts (NaN, huge integers)
+        if orjson is not None:
+            try:
+                data = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                data = json_lib.loads(raw)
+        else:
+            data = json_lib.loads(raw)
         
         # Apply query if specified
         if query:
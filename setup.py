@@ -31,9 +31,13 @@ setup(
     python_requires=">=3.7",
     install_requires=[
         "click>=8.0.0",
-        "psutil>=5.8.0",
+        "psutil>=6.0.0",
         "requests>=2.25.0",
     ],
+    extras_require={
+        "macos": ["pyobjc-framework-Cocoa; sys_platform == 'darwin'"],
+        "json": ["orjson"],
+    },
     entry_points={
         "console_scripts": [
             "mcli=mcli.cli:main",
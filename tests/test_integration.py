@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 """Basic integration tests for the CLI."""
 
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 def run_command(cmd):
@@ -26,6 +31,13 @@ def run_command(cmd):
 
 def test_cli():
     """Test basic CLI functionality."""
+    # Scratch files for commands that need real input
+    tmp = tempfile.mkdtemp()
+    for name, content in (('a.txt', 'hello\n'), ('b.txt', 'hello\n'),
+                          ('one.sh', 'echo one\n'), ('two.sh', 'echo two\n')):
+        with open(os.path.join(tmp, name), 'w') as f:
+            f.write(content)
+    
     tests = [
         # Basic help commands
         ("python3 -m mcli.cli --help", "Test main help"),
@@ -35,6 +47,9 @@ def test_cli():
         ("python3 -m mcli.cli files --help", "Test files help"),
         ("python3 -m mcli.cli files duplicates --help", "Test duplicates help"),
         ("python3 -m mcli.cli files diskusage /tmp", "Test disk usage"),
+        (f"python3 -m mcli.cli files duplicates {tmp} --min-size 1 --no-skip",
+         "Test duplicates --no-skip"),
+        (f"python3 -m mcli.cli files search hello {tmp} --no-skip", "Test search --no-skip"),
         
         # System commands
         ("python3 -m mcli.cli system --help", "Test system help"),
@@ -48,6 +63,10 @@ def test_cli():
         ("python3 -m mcli.cli utils runscript --help", "Test runscript help"),
         ("python3 -m mcli.cli utils grep --help", "Test grep help"),
         ("python3 -m mcli.cli utils transform 'test' --upper", "Test transform"),
+        (f"python3 -m mcli.cli utils runall {tmp} --jobs 2", "Test runall --jobs"),
+        (f"python3 -m mcli.cli utils zip -c --level 9 {tmp}/a.txt {tmp}/out.zip",
+         "Test zip --level"),
+        (f"python3 -m mcli.cli utils base64 --file {tmp}/a.txt", "Test base64 --file"),
         
         # Admin commands
         ("python3 -m mcli.cli admin --help", "Test admin help"),
@@ -56,6 +75,7 @@ def test_cli():
         
         # Network (basic checks)
         ("python3 -m mcli.cli network --help", "Test network help"),
+        ("python3 -m mcli.cli network speedtest --parallel --help", "Test speedtest --parallel help"),
     ]
     
     passed = 0
@@ -80,9 +100,37 @@ def test_cli():
     print("=" * 70)
     print(f"\nResults: {passed} passed, {failed} failed")
     
+    shutil.rmtree(tmp, ignore_errors=True)
+    
     return failed == 0
 
 
+def test_grep_blocks():
+    """Test grep line numbers across search blocks and line endings."""
+    from mcli.commands import utils
+    
+    data = (b'alpha\nFoo one\r\nbar\rfoo two\n' + b'x' * 100 + b' foo long\n'
+            b'\xff\xfe foo bytes\nlast foo')
+    with tempfile.NamedTemporaryFile(delete=False) as f:
+        f.write(data)
+    
+    expected = [(4, 'foo two'), (5, 'x' * 100 + ' foo long'),
+                (6, ' foo bytes'), (7, 'last foo')]
+    block = utils._GREP_BLOCK
+    try:
+        # Blocks smaller than a line force lines to be carried over
+        for size in (block, 16, 7, 1):
+            utils._GREP_BLOCK = size
+            assert utils._grep_matches(f.name, 'foo', False) == expected, size
+            assert utils._grep_matches(f.name, 'FOO', True) == [(2, 'Foo one')] + expected, size
+            assert utils._grep_matches(f.name, 'missing', False) == [], size
+    finally:
+        utils._GREP_BLOCK = block
+        os.unlink(f.name)
+    return True
+
+
 if __name__ == "__main__":
     success = test_cli()
+    success = test_grep_blocks() and success
     sys.exit(0 if success else 1)